@@ -1,35 +1,43 @@
 import random
 import sys
 import os
+from collections import Counter
 
-def check_guess(guess, secret_word):
+GREY, YELLOW, GREEN = 0, 1, 2
+PATTERN_SYMBOLS = ('⬜️', '🟨', '🟩')  # indexed by GREY, YELLOW, GREEN
+
+def score_guess(guess, secret_word):
     """
-    Compares a guess to the secret word and returns Wordle-style feedback.
+    Compares a guess to the secret word and returns Wordle-style feedback as a
+    bytearray holding GREY, YELLOW or GREEN for each position.
     This two-pass method correctly handles duplicate letters.
     """
     length = len(secret_word)
-    result = [''] * length
-    secret_letters = list(secret_word)
+    result = bytearray(length)  # Every position starts out Grey
+    unmatched = Counter()  # Secret letters not already claimed by a Green
 
     # First pass: Check for Greens (correct letter, correct position) 🟩
     for i in range(length):
-        if guess[i] == secret_letters[i]:
-            result[i] = '🟩'
-            secret_letters[i] = None  # Mark this letter as "used"
+        if guess[i] == secret_word[i]:
+            result[i] = GREEN
+        else:
+            unmatched[secret_word[i]] += 1
 
     # Second pass: Check for Yellows (correct letter, wrong position) 🟨
     for i in range(length):
-        if result[i] == '':  # Only check letters that aren't already green
-            if guess[i] in secret_letters:
-                result[i] = '🟨'
-                secret_letters.remove(guess[i]) # Mark as used for yellow
-    
-    # Any remaining empty spots are Greys ⬜️
-    for i in range(length):
-        if result[i] == '':
-            result[i] = '⬜️'
-            
-    return "".join(result)
+        if result[i] != GREEN and unmatched[guess[i]] > 0:  # Only check letters that aren't already green
+            result[i] = YELLOW
+            unmatched[guess[i]] -= 1  # Mark as used for yellow
+
+    return result
+
+def format_pattern(pattern):
+    """Renders a feedback pattern from score_guess as emoji squares."""
+    return "".join(PATTERN_SYMBOLS[p] for p in pattern)
+
+def check_guess(guess, secret_word):
+    """Compares a guess to the secret word and returns Wordle-style emoji feedback."""
+    return format_pattern(score_guess(guess, secret_word))
 
 def play_wordle():
     """
@@ -59,7 +67,7 @@ def play_wordle():
         return
         
     secret_word = random.choice(list(valid_words))
-    guess_history = []
+    guesses, patterns = [], []  # Guess history, one entry per turn
     
     print(f"\nWordle instance started! You have {MAX_TRIES} tries to guess the {word_length}-letter word.")
     
@@ -69,8 +77,8 @@ def play_wordle():
         print(f"Turn {turn}/{MAX_TRIES}")
 
         # Display previous guesses
-        for g, r in guess_history:
-            print(f"{g.upper()}  {r}")
+        for g, p in zip(guesses, patterns):
+            print(f"{g.upper()}  {format_pattern(p)}")
             
         # Get a valid guess from the user
         while True:
@@ -83,8 +91,8 @@ def play_wordle():
                 break # Guess is valid
         
         # Check the guess and store the result
-        result = check_guess(guess, secret_word)
-        guess_history.append((guess, result))
+        guesses.append(guess)
+        patterns.append(score_guess(guess, secret_word))
         
         # Clear screen for a cleaner look
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -93,16 +101,16 @@ def play_wordle():
         if guess == secret_word:
             print("-" * 20)
             print("Congratulations! You guessed it!\n")
-            for g, r in guess_history:
-                print(f"{g.upper()}  {r}")
+            for g, p in zip(guesses, patterns):
+                print(f"{g.upper()}  {format_pattern(p)}")
             print(f"\nThe word was: {secret_word.upper()}")
             return
             
     # --- 3. End of Game (Loss) ---
     print("-" * 20)
     print("Game over! You ran out of tries.\n")
-    for g, r in guess_history:
-        print(f"{g.upper()}  {r}")
+    for g, p in zip(guesses, patterns):
+        print(f"{g.upper()}  {format_pattern(p)}")
     print(f"\nThe word was: {secret_word.upper()}")
 
 if __name__ == "__main__":
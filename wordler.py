@@ -1,6 +1,13 @@
-import re
+import math
+import os
+import string
 import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# Searches with at least this many guess/answer pairs score partitions across processes
+PARALLEL_MIN_PAIRS = 5_000_000
 
 # ANSI escape codes for colors
 class Colors:
@@ -13,6 +20,28 @@ def colorize(text, color):
     """Applies ANSI color codes to text."""
     return f"{color}{text}{Colors.ENDC}"
 
+def bits_from_indices(indices, size):
+    """Builds an int bitset with the given bit indices set."""
+    buffer = bytearray((size + 7) // 8)
+    for index in indices:
+        buffer[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(buffer, "little")
+
+def indices_from_bits(bits):
+    """Returns the indices of the set bits of an int bitset, in ascending order."""
+    return [i for i, digit in enumerate(reversed(bin(bits)[2:])) if digit == '1']
+
+_worker_solver = None
+
+def _init_partition_worker(solver):
+    """Gives a worker process its copy of the solver to score partitions with."""
+    global _worker_solver
+    _worker_solver = solver
+
+def _score_partitions(guesses, objective):
+    """Scores each guess's partition of the worker solver's possible words."""
+    return [_worker_solver._guess_partition_score(guess, objective) for guess in guesses]
+
 class WordleSolver:
     """
     A class to encapsulate the logic for solving Wordle puzzles.
@@ -20,10 +49,16 @@ class WordleSolver:
     def __init__(self, word_length=5, word_list_path="./english-words/words_alpha.txt", hard_mode=False):
         self.word_length = word_length
         self.word_list_path = word_list_path
+        self.banned_words_path = word_list_path + ".banned"  # words removed with /new
         self.hard_mode = hard_mode
         self.all_words = self._load_words()
-        self.possible_words = [w for w in self.all_words if len(w) == self.word_length]
-        self.algorithm = "minimax"  # Default algorithm
+        self.possible_words = list(self.all_words)
+        self.guess_words = list(self.possible_words)  # every allowed guess of the right length
+        self._build_pattern_tables()
+        self._alive = (1 << len(self._answers)) - 1  # bitset of possible_words over self._answers
+        self._word_letters = list(self._answer_letters)  # parallel to possible_words
+        self.algorithm = "entropy"  # Default algorithm
+        self._ranked_guesses = {}  # objective -> last search's ranking, reused until the possibilities change
 
         # Game State
         self.green_pattern = ['-'] * self.word_length
@@ -34,85 +69,218 @@ class WordleSolver:
         self.turn = 1
 
     def _load_words(self):
-        """Loads the word list from the specified path."""
+        """Loads the words of the solver's length from the word list at the specified path."""
         try:
-            with open(self.word_list_path, "r") as f:
-                return {line.strip().lower() for line in f}
+            with open(self.word_list_path, "rb") as f:
+                data = f.read()
         except FileNotFoundError:
             print(f"❌ Error: Word list not found at '{self.word_list_path}'.")
             sys.exit(1)
+        # Lowercase and split the whole file at the bytes level; only decode words that fit.
+        words = {word.decode() for word in data.lower().split() if len(word) == self.word_length}
+        try:
+            with open(self.banned_words_path, "rb") as f:
+                words.difference_update(word.decode() for word in f.read().lower().split())
+        except FileNotFoundError:
+            pass
+        return words
 
     def _remove_word_from_database(self, word_to_remove):
-        """Removes a word from the word list file."""
-        import os
-        temp_file_path = self.word_list_path + ".tmp"
+        """Removes a word from future runs by appending it to the banned words file."""
         try:
-            with open(self.word_list_path, "r") as original_file, open(temp_file_path, "w") as temp_file:
-                for line in original_file:
-                    if line.strip().lower() != word_to_remove:
-                        temp_file.write(line)
-            os.replace(temp_file_path, self.word_list_path)
-        except Exception as e:
+            with open(self.banned_words_path, "a") as banned_file:
+                banned_file.write(word_to_remove + "\n")
+        except OSError as e:
             print(f"❌ Error removing word from database: {e}")
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
 
     def find_best_guess_frequency(self):
         """Analyzes possible words to find the best next guess based on letter frequency."""
         if not self.possible_words: return None
         if len(self.possible_words) == 1: return self.possible_words[0]
 
-        letter_frequency = Counter()
-        for word in self.possible_words:
-            for letter in set(word):
-                letter_frequency[letter] += 1
-
+        letter_frequency = self._letter_frequency()
         best_word, max_score = "", -1
-        for word in self.possible_words:
-            score = sum(letter_frequency[letter] for letter in set(word))
+        for word, letters in zip(self.possible_words, self._word_letters):
+            score = sum(letter_frequency[letter] for letter in letters)
             if score > max_score:
                 max_score, best_word = score, word
         return best_word
 
-    def _get_pattern(self, guess, answer):
-        """Determines the G/Y/- pattern for a guess against a potential answer."""
-        pattern = ['-'] * self.word_length
-        used_in_answer = [False] * self.word_length
-        for i in range(self.word_length):
-            if guess[i] == answer[i]:
-                pattern[i] = 'g'
-                used_in_answer[i] = True
-        for i in range(self.word_length):
-            if pattern[i] == '-':
-                for j in range(self.word_length):
-                    if not used_in_answer[j] and guess[i] == answer[j]:
-                        pattern[i] = 'y'
-                        used_in_answer[j] = True
-                        break
-        return "".join(pattern)
+    def _letter_frequency(self):
+        """Counts the possible words containing each letter."""
+        alive = self._alive
+        return {char: (alive & count_bits[1]).bit_count() for char, count_bits in self._count_bits.items()}
+
+    def _build_pattern_tables(self):
+        """Precomputes answer bitsets from which feedback patterns and filters can be derived."""
+        self._answers = list(self.possible_words)
+        self._answer_index = {word: i for i, word in enumerate(self._answers)}
+        self._answer_letters = [frozenset(word) for word in self._answers]
+        self._position_bits, self._count_bits, self._no_count_bits = self._letter_bitsets(self._answers)
+        self._partition_tables = (self._position_bits, self._count_bits, self._no_count_bits)
+        # Patterns are base-3 ints: position 0 is the most significant digit, 2=G, 1=Y, 0=-
+        self._pattern_weights = [3 ** (self.word_length - 1 - i) for i in range(self.word_length)]
+        self._log_table = [0.0] + [math.log(n) for n in range(1, len(self._answers) + 1)]
+
+    def _letter_bitsets(self, words):
+        """
+        Builds bitsets over a word list (bit i = words[i]):
+        position_bits[i][char] holds words with char at position i, and count_bits[char][k]
+        words with at least k copies of char (k = 0..word_length + 1). no_count_bits is the
+        count_bits row for a letter that appears in none of the words.
+        """
+        size = len(words)
+        position_members = [defaultdict(list) for _ in range(self.word_length)]
+        count_members = defaultdict(lambda: [[] for _ in range(self.word_length + 1)])
+        for index, word in enumerate(words):
+            for i, char in enumerate(word):
+                position_members[i][char].append(index)
+            for char, count in Counter(word).items():
+                for k in range(1, count + 1):
+                    count_members[char][k].append(index)
+        all_bits = (1 << size) - 1
+        position_bits = [{char: bits_from_indices(members, size) for char, members in position.items()}
+                         for position in position_members]
+        count_bits = {char: [all_bits] + [bits_from_indices(members, size) for members in counts[1:]] + [0]
+                      for char, counts in count_members.items()}
+        return position_bits, count_bits, [all_bits] + [0] * (self.word_length + 1)
+
+    def _pattern_buckets(self, guess):
+        """Partitions possible_words by the pattern the guess would produce: {pattern: bitset over possible_words}."""
+        position_bits, count_bits, no_count_bits = self._partition_tables
+        weights = self._pattern_weights
+        parts = [(0, 0, (1 << len(self.possible_words)) - 1)]  # (green positions mask, pattern, answers)
+        for i, char in enumerate(guess):
+            bits = position_bits[i].get(char, 0)
+            split = []
+            for greens, pattern, part in parts:
+                matched = part & bits
+                if matched: split.append((greens | 1 << i, pattern + 2 * weights[i], matched))
+                if matched != part: split.append((greens, pattern, part ^ matched))
+            parts = split
+
+        # Masks over guess positions holding the same letter as position i: all others, and earlier ones
+        same = [sum(1 << j for j, other in enumerate(guess) if other == char and j != i) for i, char in enumerate(guess)]
+        earlier = [mask & ((1 << i) - 1) for i, mask in enumerate(same)]
+        buckets = {}
+        for greens, pattern, part in parts:
+            # A non-green letter is yellow while the answer still holds an unmatched copy of it,
+            # i.e. it has more copies than the greens plus the earlier non-green uses of that letter.
+            subparts = [(pattern, part)]
+            for i, char in enumerate(guess):
+                if greens >> i & 1: continue
+                needed = 1 + (greens & same[i]).bit_count() + (earlier[i] & ~greens).bit_count()
+                bits = count_bits.get(char, no_count_bits)[needed]
+                split = []
+                for pattern, subpart in subparts:
+                    matched = subpart & bits
+                    if matched: split.append((pattern + weights[i], matched))
+                    if matched != subpart: split.append((pattern, subpart ^ matched))
+                subparts = split
+            buckets.update(subparts)
+        return buckets
 
-    def find_best_guess_minimax(self):
-        """Finds the best guess by minimizing the maximum number of remaining possibilities."""
+    def find_best_guess(self, algorithm=None):
+        """Suggests the next guess with the given algorithm, defaulting to self.algorithm."""
+        algorithm = algorithm or self.algorithm
+        if algorithm == "frequency":
+            return self.find_best_guess_frequency()
+        return self.find_best_guess_minimax(objective=algorithm)
+
+    def find_best_guess_minimax(self, objective="minimax"):
+        """
+        Finds the guess that best splits the remaining possibilities into feedback buckets.
+        "minimax" minimizes the largest bucket; "sumsq" minimizes the sum of squared bucket
+        sizes (proportional to the expected number of words left), breaking ties on the largest;
+        "entropy" maximizes the information gained by minimizing the sum of n*log(n) over bucket sizes.
+        """
         if not self.possible_words: return None
         if len(self.possible_words) == 1: return self.possible_words[0]
 
-        best_guess, min_max_remaining = "", float('inf')
-        guess_candidates = list(self.all_words) if len(self.possible_words) > 2 else self.possible_words
+        # A /new retry leaves the possibilities unchanged, so the previous ranking still applies once
+        # the rejected words are dropped. Its head is only trustworthy if the search that built it
+        # scored every remaining contender, or if the head reaches the best score a guess can get.
+        if objective in self._ranked_guesses:
+            ranked, exhaustive, perfect_score = self._ranked_guesses[objective]
+            while ranked and ranked[0][1] not in self.all_words:
+                ranked.pop(0)
+            if ranked and (exhaustive or ranked[0][0] == perfect_score):
+                return ranked[0][1]
+
+        guess_candidates = self.guess_words if len(self.possible_words) > 2 else self.possible_words
+        answer_index = self._answer_index
+        # Try guesses with common letters first: they tend to split well, so the search is more likely
+        # to hit a possible answer that reaches the best score any partition could have and stop early.
+        letter_frequency = self._letter_frequency()
+        guess_candidates = sorted(guess_candidates, reverse=True, key=lambda guess: sum(
+            letter_frequency[char] for char in self._answer_letters[answer_index[guess]]))
+        bucket_count = min(len(self.possible_words), 3 ** self.word_length)
+        q, r = divmod(len(self.possible_words), bucket_count)
+        best_possible_score = self._partition_score([q + 1] * r + [q] * (bucket_count - r), objective)
+
+        # Letters in none of the possible words always come back grey, so guesses that only differ
+        # in those letters split the possibilities identically and need scoring just once.
+        present_letters = self._partition_tables[1]
+        absent = str.maketrans({char: '.' for char in string.ascii_lowercase if char not in present_letters})
+        partition_scores = {}
+        if len(guess_candidates) * len(self.possible_words) >= PARALLEL_MIN_PAIRS and (os.cpu_count() or 1) > 1:
+            # Big searches rarely stop early, so score every distinct partition up front in parallel.
+            representatives = {}
+            for guess in guess_candidates:
+                representatives.setdefault(guess.translate(absent), guess)
+            scores = self._score_partitions_in_parallel(list(representatives.values()), objective)
+            partition_scores.update(zip(representatives, scores))
+
+        def score(guess):
+            fingerprint = guess.translate(absent)
+            partition_score = partition_scores.get(fingerprint)
+            if partition_score is None:
+                partition_score = partition_scores[fingerprint] = self._guess_partition_score(guess, objective)
+            return partition_score
 
+        possible_words = set(self.possible_words)
+        ranked, best_score, only_possible, exhaustive = [], None, False, True
         for guess in guess_candidates:
-            if len(guess) != self.word_length: continue
-            pattern_counts = defaultdict(int)
-            for answer in self.possible_words:
-                pattern = self._get_pattern(guess, answer)
-                pattern_counts[pattern] += 1
-            max_remaining = max(pattern_counts.values())
-
-            if max_remaining < min_max_remaining:
-                min_max_remaining, best_guess = max_remaining, guess
-            elif max_remaining == min_max_remaining:
-                if guess in self.possible_words and best_guess not in self.possible_words:
-                    best_guess = guess
-        return best_guess
+            # Ties go to guesses that could themselves be the answer.
+            impossible = guess not in possible_words
+            if only_possible and impossible:
+                exhaustive = False
+                continue
+            guess_score = score(guess) + (impossible,)
+            ranked.append((guess_score, guess))
+            if best_score is None or guess_score < best_score:
+                best_score = guess_score
+                if guess_score[:-1] == best_possible_score:
+                    if not impossible:
+                        exhaustive = False
+                        break
+                    # Nothing splits better, so only a possible answer splitting as well can still win.
+                    only_possible = True
+
+        ranked.sort(key=lambda entry: entry[0])  # stable, so equal scores keep candidate order
+        self._ranked_guesses[objective] = (ranked, exhaustive, best_possible_score + (False,))
+        return ranked[0][1]
+
+    def _score_partitions_in_parallel(self, guesses, objective):
+        """Scores the guesses' partitions across one worker process per CPU, returning scores in guess order."""
+        workers = os.cpu_count()
+        chunk_size = -(-len(guesses) // (workers * 4))
+        chunks = [guesses[i:i + chunk_size] for i in range(0, len(guesses), chunk_size)]
+        with ProcessPoolExecutor(workers, initializer=_init_partition_worker, initargs=(self,)) as executor:
+            return [score for chunk in executor.map(_score_partitions, chunks, repeat(objective)) for score in chunk]
+
+    def _guess_partition_score(self, guess, objective):
+        """Scores how the guess splits the possible words for an objective; lower is better."""
+        sizes = map(int.bit_count, self._pattern_buckets(guess).values())
+        return self._partition_score(list(sizes), objective)
+
+    def _partition_score(self, sizes, objective):
+        """Scores a partition of the possible words by its bucket sizes for an objective; lower is better."""
+        if objective == "entropy":
+            return math.fsum(n * self._log_table[n] for n in sizes),
+        if objective == "sumsq":
+            return sum(n * n for n in sizes), max(sizes)
+        return max(sizes),
 
     def _update_knowledge(self, guess, results):
         """Updates the solver's knowledge based on the results of a guess."""
@@ -135,25 +303,33 @@ class WordleSolver:
                 self.greys.add(char)
 
     def _filter_words(self):
-        """Filters the list of possible words based on all current knowledge."""
-        temp_possible_words = []
-        green_regex = re.compile("".join(self.green_pattern).replace('-', '.'))
-        for word in self.possible_words:
-            if not green_regex.match(word): continue
-            if any(c in self.greys for c in word): continue
-            word_counts = Counter(word)
-            valid = True
-            for char, count in self.letter_min_counts.items():
-                if word_counts[char] < count: valid = False; break
-            if not valid: continue
-            for char, count in self.letter_max_counts.items():
-                if word_counts[char] != count: valid = False; break
-            if not valid: continue
-            for char, positions in self.yellow_misplaced.items():
-                if any(word[pos] == char for pos in positions): valid = False; break
-            if not valid: continue
-            temp_possible_words.append(word)
-        self.possible_words = temp_possible_words
+        """Filters the possible words down to those consistent with all current knowledge."""
+        # Every constraint narrows the whole alive set at once.
+        alive = self._alive
+        for i, char in enumerate(self.green_pattern):
+            if char != '-':
+                alive &= self._position_bits[i].get(char, 0)
+        for char, positions in self.yellow_misplaced.items():
+            for pos in positions:
+                alive &= ~self._position_bits[pos].get(char, 0)
+        for char, count in self.letter_min_counts.items():
+            alive &= self._count_bits.get(char, self._no_count_bits)[count]
+        for char, count in self.letter_max_counts.items():
+            count_bits = self._count_bits.get(char, self._no_count_bits)
+            alive &= count_bits[count] & ~count_bits[count + 1]
+        for char in self.greys:
+            alive &= ~self._count_bits.get(char, self._no_count_bits)[1]  # answers containing char
+        self._alive = alive
+        self._sync_possible_words()
+
+    def _sync_possible_words(self):
+        """Rebuilds possible_words, its parallel distinct letters and the partition tables from the alive bitset."""
+        indices = indices_from_bits(self._alive)
+        self.possible_words = [self._answers[i] for i in indices]
+        self._word_letters = [self._answer_letters[i] for i in indices]
+        # Partitioning works on bitsets over the survivors only, so its cost shrinks with them
+        self._partition_tables = self._letter_bitsets(self.possible_words)
+        self._ranked_guesses.clear()
 
     def _is_valid_hard_mode_guess(self, guess):
         """Checks if a guess is valid under hard mode rules."""
@@ -172,12 +348,18 @@ class WordleSolver:
     def run(self):
         """Runs the main interactive loop for the solver."""
         print("--- Wordle Solver ---")
-        algo_choice = input("Choose algorithm (1=Frequency, 2=Minimax) [2]: ").strip()
+        algo_choice = input("Choose algorithm (1=Frequency, 2=Minimax, 3=Entropy, 4=Sum of squares) [3]: ").strip()
         if algo_choice == '1':
             self.algorithm = "frequency"
             print("Using Frequency-based algorithm.")
-        else:
+        elif algo_choice == '2':
+            self.algorithm = "minimax"
             print("Using Minimax algorithm (can be slow on first turn).")
+        elif algo_choice == '4':
+            self.algorithm = "sumsq"
+            print("Using Sum of squares algorithm (can be slow on first turn).")
+        else:
+            print("Using Entropy algorithm (can be slow on first turn).")
         
         hard_mode_choice = input("Enable Hard Mode? (y/N) [N]: ").strip().lower()
         if hard_mode_choice == 'y':
@@ -191,7 +373,7 @@ class WordleSolver:
             if len(self.possible_words) < 20:
                 print("Possibilities:", ", ".join(self.possible_words))
 
-            suggested_guess = self.find_best_guess_minimax() if self.algorithm == "minimax" else self.find_best_guess_frequency()
+            suggested_guess = self.find_best_guess()
             if not suggested_guess:
                 print("🤔 Hmm, no words match all the criteria. There might be an error in the clues provided.")
                 return
@@ -213,8 +395,10 @@ class WordleSolver:
                     if suggested_guess:
                         print(f"Removing '{suggested_guess}' from the word list and getting a new suggestion.")
                         self.all_words.remove(suggested_guess)
+                        self.guess_words.remove(suggested_guess)
                         if suggested_guess in self.possible_words:
-                            self.possible_words.remove(suggested_guess)
+                            self._alive &= ~(1 << self._answer_index[suggested_guess])
+                            self._sync_possible_words()
                         self._remove_word_from_database(suggested_guess)
                     break
                 elif len(last_guess) != self.word_length: